@@ -1,14 +1,16 @@
 """Example 01: Minimal Pipeline
 
 Demonstrates the simplest dataflow: generator → transformer → aggregator
+
+The transformer nodes sleep to simulate blocking I/O. Set SIMULATE_IO=0 to
+skip the sleeps when timing the executor itself.
 """
 
 import sys
 sys.path.insert(0, '/home/runner/work/graph-sp/graph-sp/examples/py')
 
-from benchmark_utils import Benchmark, print_header, print_section
+from benchmark_utils import Benchmark, print_header, print_section, simulate_io, warmup
 import dagex
-import time
 
 
 def generate(_inputs):
@@ -22,7 +24,7 @@ def double(inputs):
     
     # Simulate I/O or blocking operation that releases the GIL
     # This allows true parallel execution in Python
-    time.sleep(0.15)
+    simulate_io(0.15)
     
     return {"result": value * 2}
 
@@ -33,7 +35,7 @@ def add_five(inputs):
     
     # Simulate I/O or blocking operation that releases the GIL
     # This allows true parallel execution in Python
-    time.sleep(0.15)
+    simulate_io(0.15)
     
     return {"final": value + 5}
 
@@ -77,6 +79,8 @@ def main():
     print("  Generator → Doubler → AddFive")
     print("     (10)       (20)       (25)")
     
+    warmup(dag)
+    
     print_section("Sequential Execution (parallel=False)")
     
     with Benchmark("Sequential execution") as bench_seq:
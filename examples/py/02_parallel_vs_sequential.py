@@ -4,10 +4,9 @@ Demonstrates how independent nodes execute in parallel
 """
 
 import sys
-import time
 sys.path.insert(0, '/home/runner/work/graph-sp/graph-sp/examples/py')
 
-from benchmark_utils import Benchmark, print_header, print_section
+from benchmark_utils import Benchmark, print_header, print_section, simulate_io, warmup
 import dagex
 
 
@@ -20,7 +19,7 @@ def task_a(inputs):
     """Task A: add 10 with simulated work."""
     value = inputs.get("input", 0)
     # Simulate some work
-    time.sleep(0.15)
+    simulate_io(0.15)
     return {"result_a": value + 10}
 
 
@@ -28,7 +27,7 @@ def task_b(inputs):
     """Task B: add 20 with simulated work."""
     value = inputs.get("input", 0)
     # Simulate some work
-    time.sleep(0.15)
+    simulate_io(0.15)
     return {"result_b": value + 20}
 
 
@@ -36,7 +35,7 @@ def task_c(inputs):
     """Task C: add 30 with simulated work."""
     value = inputs.get("input", 0)
     # Simulate some work
-    time.sleep(0.15)
+    simulate_io(0.15)
     return {"result_c": value + 30}
 
 
@@ -89,6 +88,8 @@ def main():
     print("       \\")
     print("        TaskC (+30)")
     
+    warmup(dag)
+    
     print_section("Sequential Execution")
     
     with Benchmark("Sequential execution") as bench_seq:
@@ -7,9 +7,8 @@ expose the merge API, so this example shows branching without explicit merging.
 import sys
 sys.path.insert(0, '/home/runner/work/graph-sp/graph-sp/examples/py')
 
-from benchmark_utils import Benchmark, print_header, print_section
+from benchmark_utils import Benchmark, print_header, print_section, simulate_io, warmup
 import dagex
-import time
 
 
 def source(_inputs):
@@ -23,7 +22,7 @@ def path_a(inputs):
     
     # Simulate I/O or blocking operation that releases the GIL
     # This allows true parallel execution in Python
-    time.sleep(0.15)
+    simulate_io(0.15)
     
     return {"result": value + 10}
 
@@ -34,7 +33,7 @@ def path_b(inputs):
     
     # Simulate I/O or blocking operation that releases the GIL
     # This allows true parallel execution in Python
-    time.sleep(0.15)
+    simulate_io(0.15)
     
     return {"result": value + 20}
 
@@ -107,6 +106,8 @@ def main():
     print("         \\                /")
     print("          PathB (+20) ──┘")
     
+    warmup(dag)
+    
     print_section("Sequential Execution (parallel=False)")
     
     with Benchmark("Sequential execution") as bench_seq:
@@ -4,11 +4,11 @@ Demonstrates running multiple nodes with the same structure but different parame
 """
 
 import sys
+from functools import partial
 sys.path.insert(0, '/home/runner/work/graph-sp/graph-sp/examples/py')
 
-from benchmark_utils import Benchmark, print_header, print_section
+from benchmark_utils import Benchmark, print_header, print_section, simulate_io, warmup
 import dagex
-import time
 
 
 def data_source(_inputs):
@@ -16,17 +16,20 @@ def data_source(_inputs):
     return {"base": 10}
 
 
+def _multiply(inputs, factor):
+    """Multiply the input value by `factor`."""
+    value = inputs.get("x", 0)
+    
+    # Simulate I/O or blocking operation that releases the GIL
+    # This allows true parallel execution in Python
+    simulate_io(0.15)
+    
+    return {"result": value * factor}
+
+
 def make_multiplier(factor):
     """Factory function to create multiplier variants."""
-    def multiplier(inputs):
-        value = inputs.get("x", 0)
-        
-        # Simulate I/O or blocking operation that releases the GIL
-        # This allows true parallel execution in Python
-        time.sleep(0.15)
-        
-        return {"result": value * factor}
-    return multiplier
+    return partial(_multiply, factor=factor)
 
 
 def main():
@@ -75,6 +78,8 @@ def main():
     print("               \\")
     print("                Multiplier(×7)")
     
+    warmup(dag)
+    
     print_section("Sequential Execution (parallel=False)")
     
     with Benchmark("Sequential execution") as bench_seq:
@@ -4,44 +4,30 @@ Demonstrates efficient memory handling for large data in Python
 """
 
 import sys
+from functools import partial
 sys.path.insert(0, '/home/runner/work/graph-sp/graph-sp/examples/py')
 
-from benchmark_utils import Benchmark, print_header, print_section
+from benchmark_utils import Benchmark, print_header, print_section, warmup
 import dagex
+import numpy as np
 
 
 def create_large_data(_inputs):
     """Create a large dataset."""
-    # Create a large list (simulating a large dataset)
-    large_list = list(range(1_000_000))
+    # With share_arrays=True this NumPy array crosses the Python/Rust boundary
+    # as the same object, so every consumer receives a reference to this one
+    # buffer. int32 holds the whole range in 4 MB, half the footprint of int64.
+    large_array = np.arange(1_000_000, dtype=np.int32)
     
-    # In Python, objects are reference-counted, so passing the list
-    # to multiple consumers doesn't create copies unless modified
-    return {"large_data": large_list}
+    return {"large_data": large_array}
 
 
-def consumer_a(inputs):
-    """Consumer A: process first segment."""
-    data = inputs.get("data", [])
-    # Access the data by reference - Python won't copy unless we modify
-    sum_a = sum(data[:1000])
-    return {"sum_a": sum_a}
-
-
-def consumer_b(inputs):
-    """Consumer B: process second segment."""
-    data = inputs.get("data", [])
-    # Access the data by reference - Python won't copy unless we modify
-    sum_b = sum(data[1000:2000])
-    return {"sum_b": sum_b}
-
-
-def consumer_c(inputs):
-    """Consumer C: process third segment."""
-    data = inputs.get("data", [])
-    # Access the data by reference - Python won't copy unless we modify
-    sum_c = sum(data[2000:3000])
-    return {"sum_c": sum_c}
+def sum_segment(inputs, lo, hi):
+    """Consumer: sum the [lo, hi) segment of the shared data."""
+    data = inputs["data"]
+    # Slicing an ndarray is a zero-copy view; np.add.reduce runs the typed
+    # add loop directly, without ndarray.sum()'s argument handling
+    return {"sum": int(np.add.reduce(data[lo:hi]))}
 
 
 def main():
@@ -49,10 +35,10 @@ def main():
     
     print("📖 Story:")
     print("   When working with large data, copying it between nodes is expensive.")
-    print("   In Python, objects are reference-counted, so passing lists/arrays")
-    print("   to multiple consumers shares references rather than copying data.")
-    print("   For even better performance, use NumPy arrays which are efficiently")
-    print("   passed through the Python/Rust boundary.\n")
+    print("   A node added with share_arrays=True passes its NumPy arrays through")
+    print("   the Python/Rust boundary untouched, so every consumer shares a")
+    print("   reference to the same buffer rather than receiving a copy.")
+    print("   (Without it, arrays are converted element by element.)\n")
     
     print_section("Building the Graph")
     
@@ -63,29 +49,30 @@ def main():
         create_large_data,
         label="CreateLargeData",
         inputs=None,
-        outputs=[("large_data", "data")]
+        outputs=[("large_data", "data")],
+        share_arrays=True,  # consumers only read the buffer, never modify it
     )
     
     # Add multiple consumers that share the large data
     graph.add(
-        consumer_a,
+        partial(sum_segment, lo=0, hi=1000),
         label="ConsumerA",
         inputs=[("data", "data")],
-        outputs=[("sum_a", "sum_a")]
+        outputs=[("sum", "sum_a")]
     )
     
     graph.add(
-        consumer_b,
+        partial(sum_segment, lo=1000, hi=2000),
         label="ConsumerB",
         inputs=[("data", "data")],
-        outputs=[("sum_b", "sum_b")]
+        outputs=[("sum", "sum_b")]
     )
     
     graph.add(
-        consumer_c,
+        partial(sum_segment, lo=2000, hi=3000),
         label="ConsumerC",
         inputs=[("data", "data")],
-        outputs=[("sum_c", "sum_c")]
+        outputs=[("sum", "sum_c")]
     )
     
     dag = graph.build()
@@ -101,21 +88,27 @@ def main():
     print("                      ConsumerC")
     
     print("💡 Key insight: The large data (1M integers) is created once")
-    print("   and shared by reference. Python's reference counting ensures")
-    print("   efficient memory usage.\n")
+    print("   and shared by reference. Each consumer slices a zero-copy view")
+    print("   of the same NumPy buffer.\n")
+    
+    warmup(dag)
     
     print_section("Sequential Execution (parallel=False)")
     
-    with Benchmark("Sequential execution") as bench_seq:
-        context_seq = dag.execute(parallel=False)
+    # There is no simulated I/O here, so single runs are short and noisy;
+    # report the median of several instead
+    bench_seq, context_seq = Benchmark.median_of(
+        "Sequential execution", lambda: dag.execute(parallel=False)
+    )
     
     bench_seq.print_result()
     result_seq = bench_seq.result
     
     print_section("Parallel Execution (parallel=True)")
     
-    with Benchmark("Parallel execution") as bench_par:
-        context_par = dag.execute(parallel=True, max_threads=4)
+    bench_par, context_par = Benchmark.median_of(
+        "Parallel execution", lambda: dag.execute(parallel=True, max_threads=4)
+    )
     
     bench_par.print_result()
     result_par = bench_par.result
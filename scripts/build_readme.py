@@ -9,16 +9,51 @@ This script:
 4. Generates README.md and README_PYPI.md with embedded outputs
 """
 
+import argparse
+import importlib.util
+import json
+import os
 import subprocess
 import sys
+import sysconfig
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
+
+
+# Examples embedded in the READMEs, in order (same names for Rust and Python)
+EXAMPLE_NAMES = (
+    "01_minimal_pipeline",
+    "02_parallel_vs_sequential",
+    "03_branch_and_merge",
+    "04_variants_sweep",
+    "05_output_access",
+    "06_graphdata_large_payload_arc_or_shared_data",
+)
+
+# Execution section titles, with or without the "(parallel=...)" suffix
+PERFORMANCE_TITLE_RE = re.compile(
+    r"(Sequential|Parallel)(?: Execution)?(?: \(parallel=(?:false|true)\))?",
+    re.IGNORECASE,
+)
+
+# Performance lines are recognised by their leading emoji
+PERFORMANCE_LINE_KINDS = {'⏱': "runtime", '💾': "memory", '⚡': "speedup"}
 
 
 class ExampleOutput:
     """Holds parsed output from an example."""
-    
+
+    __slots__ = (
+        'name',
+        'mermaid_diagram',
+        'performance_sequential',
+        'performance_parallel',
+        'results',
+        'speedup',
+    )
+
     def __init__(self, name: str):
         self.name = name
         self.mermaid_diagram = ""
@@ -28,6 +63,128 @@ class ExampleOutput:
         self.speedup = ""
 
 
+# ExampleOutput fields stored in the parsed-output cache
+CACHED_FIELDS = (
+    "mermaid_diagram",
+    "performance_sequential",
+    "performance_parallel",
+    "results",
+    "speedup",
+)
+
+
+# Environment variables read by examples/py/benchmark_utils.py that change what
+# the Python examples print (simulated I/O sleeps, 💾 memory lines)
+OUTPUT_ENV_VARS = ("SIMULATE_IO", "BENCH_MEM")
+
+
+def python_run_settings() -> str:
+    """Describe the interpreter and environment the Python examples run under."""
+    env = ",".join(f"{name}={os.environ.get(name, '')}" for name in OUTPUT_ENV_VARS)
+    return f"{sys.executable}|{env}"
+
+
+def load_cache(cache_path: Path) -> Dict[str, Dict[str, str]]:
+    """Load the parsed-output cache, or start empty if it is missing or unreadable."""
+    try:
+        with open(cache_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache_path: Path, cache: Dict[str, Dict[str, str]]) -> None:
+    """Write the parsed-output cache."""
+    with open(cache_path, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+def library_stamp(repo_root: Path) -> int:
+    """Return the newest mtime among the sources every example depends on."""
+    paths = [repo_root / "Cargo.toml", repo_root / "Cargo.lock", repo_root / "pyproject.toml"]
+    paths.extend((repo_root / "src").rglob("*.rs"))
+    paths.extend((repo_root / "dagex").rglob("*.py"))
+    paths.extend((repo_root / "examples").glob("*/benchmark_utils.*"))
+    return max((path.stat().st_mtime_ns for path in paths if path.exists()), default=0)
+
+
+def is_cached(cache: Dict[str, Dict[str, str]], key: str, fingerprint: str) -> bool:
+    """Return True if the cache holds an entry for `key` with this fingerprint."""
+    entry = cache.get(key)
+    return entry is not None and entry.get("fingerprint") == fingerprint
+
+
+def run_or_load(
+    cache: Dict[str, Dict[str, str]],
+    key: str,
+    fingerprint: str,
+    example_name: str,
+    run: Callable[[], str]
+) -> Optional[ExampleOutput]:
+    """Return an example's parsed output, running it only on a cache miss."""
+    if is_cached(cache, key, fingerprint):
+        print(f"  Using cached output: {example_name}")
+        parsed = ExampleOutput(example_name)
+        for field in CACHED_FIELDS:
+            setattr(parsed, field, cache[key].get(field, ""))
+        return parsed
+
+    output = run()
+    if not output:
+        return None
+    parsed = parse_example_output(output, example_name)
+    cache[key] = {"fingerprint": fingerprint}
+    cache[key].update((field, getattr(parsed, field)) for field in CACHED_FIELDS)
+    return parsed
+
+
+def build_rust_examples(repo_root: Path) -> None:
+    """Compile all Rust examples in a single cargo invocation."""
+    print("  Building Rust examples")
+    try:
+        result = subprocess.run(
+            ["cargo", "build", "--examples", "--release"],
+            cwd=repo_root,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=600
+        )
+        if result.returncode != 0:
+            print("    WARNING: cargo build failed, examples will build individually")
+    except subprocess.TimeoutExpired:
+        print("    WARNING: cargo build timed out")
+    except Exception as e:
+        print(f"    ERROR: Failed to build examples: {e}")
+
+
+def python_extension_is_current(repo_root: Path) -> bool:
+    """Return True if the in-tree extension build is installed and newer than its Rust sources."""
+    # The install step also provides NumPy for the examples, so it can only be
+    # skipped when this interpreter imports this checkout's dagex and NumPy
+    dagex_spec = importlib.util.find_spec("dagex")
+    if dagex_spec is None or dagex_spec.origin is None:
+        return False
+    if Path(dagex_spec.origin).resolve().parent != (repo_root / "dagex").resolve():
+        return False
+    if importlib.util.find_spec("numpy") is None:
+        return False
+
+    # An editable install places the compiled module next to dagex/__init__.py.
+    # Only a build for the running interpreter counts: a stale module left by
+    # another Python version would not be importable here.
+    ext_suffix = sysconfig.get_config_var("EXT_SUFFIX")
+    if not ext_suffix:
+        return False
+    built = repo_root / "dagex" / f"dagex{ext_suffix}"
+    if not built.exists():
+        return False
+    built_mtime = built.stat().st_mtime
+
+    sources = [repo_root / "Cargo.toml", repo_root / "Cargo.lock", repo_root / "pyproject.toml"]
+    sources.extend((repo_root / "src").rglob("*.rs"))
+    return all(path.stat().st_mtime <= built_mtime for path in sources if path.exists())
+
+
 def run_rust_example(example_name: str, repo_root: Path) -> str:
     """Run a Rust example and capture its output."""
     print(f"  Running Rust example: {example_name}")
@@ -35,11 +192,15 @@ def run_rust_example(example_name: str, repo_root: Path) -> str:
         result = subprocess.run(
             ["cargo", "run", "--example", example_name, "--release"],
             cwd=repo_root,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             timeout=120
         )
-        # Only return stdout, not stderr which contains cargo build messages
+        # Only stdout is parsed; cargo build messages on stderr are discarded
+        if result.returncode != 0:
+            print(f"    WARNING: {example_name} exited with status {result.returncode}")
+            return ""
         return result.stdout
     except subprocess.TimeoutExpired:
         print(f"    WARNING: {example_name} timed out")
@@ -54,13 +215,19 @@ def run_python_example(example_file: Path, repo_root: Path) -> str:
     print(f"  Running Python example: {example_file.name}")
     try:
         result = subprocess.run(
-            ["python3", str(example_file)],
+            [sys.executable, str(example_file)],
             cwd=repo_root,
             capture_output=True,
             text=True,
             timeout=120
         )
-        # Only return stdout, not stderr
+        if result.returncode != 0:
+            # Python examples write little to stderr, so keep the error for the warning
+            error = result.stderr.strip().splitlines()
+            print(f"    WARNING: {example_file.name} exited with status {result.returncode}")
+            if error:
+                print(f"      {error[-1]}")
+            return ""
         return result.stdout
     except subprocess.TimeoutExpired:
         print(f"    WARNING: {example_file.name} timed out")
@@ -70,92 +237,90 @@ def run_python_example(example_file: Path, repo_root: Path) -> str:
         return ""
 
 
-def extract_mermaid_diagram(output: str) -> str:
+def index_sections(lines: List[str]) -> Dict[str, int]:
+    """Map each print_section title to the index of its first body line."""
+    sections: Dict[str, int] = {}
+    for i in range(len(lines) - 1):
+        # A section header is its title line followed by a ─ rule
+        if lines[i + 1].startswith('─'):
+            title = lines[i].strip()
+            if title and not title.startswith(('─', '═')):
+                sections.setdefault(title, i + 2)
+    return sections
+
+
+def section_lines(lines: List[str], start: Optional[int], stop: Tuple[str, ...]) -> List[str]:
+    """Return the raw lines of a section body, up to the next stop rule."""
+    if start is None:
+        return []
+    body = []
+    for line in lines[start:]:
+        if line.startswith(stop):
+            break
+        body.append(line)
+    return body
+
+
+def extract_mermaid_diagram(lines: List[str], sections: Dict[str, int]) -> str:
     """Extract Mermaid diagram from output."""
     # Look for content between "Mermaid Diagram" and the next section separator
-    pattern = r"Mermaid Diagram\s*─+\s*\n(.*?)(?:\n─+|\n═+|\Z)"
-    match = re.search(pattern, output, re.DOTALL)
-    if match:
-        content = match.group(1).strip()
-        # Remove any leading/trailing graph TD if present
-        lines = content.split('\n')
-        # Filter out empty lines and keep only the graph content
-        lines = [line.strip() for line in lines if line.strip()]
-        return '\n'.join(lines)
-    return ""
-
-
-def extract_performance(output: str, execution_type: str) -> Tuple[str, str]:
+    body = section_lines(lines, sections.get("Mermaid Diagram"), ('─', '═'))
+    # Filter out empty lines and keep only the graph content
+    body = [stripped for line in body if (stripped := line.strip())]
+    return '\n'.join(body)
+
+
+def extract_performance(lines: List[str], sections: Dict[str, int], execution_type: str) -> Tuple[str, str]:
     """Extract performance metrics and speedup."""
     # Look for Sequential or Parallel execution section
-    # Need to match the section header with dashes below it
-    if execution_type == "sequential":
-        # Try both patterns with and without "(parallel=...)"
-        patterns = [
-            r"─+\s*\nSequential Execution\s*\n─+\s*\n(.*?)(?:\n─+|\n═+|\Z)",
-            r"─+\s*\nSequential Execution \(parallel=false\)\s*\n─+\s*\n(.*?)(?:\n─+|\n═+|\Z)",
-            r"─+\s*\nSequential Execution \(parallel=False\)\s*\n─+\s*\n(.*?)(?:\n─+|\n═+|\Z)",
-            r"─+\s*\nSequential \(parallel=false\)\s*\n─+\s*\n(.*?)(?:\n─+|\n═+|\Z)",
-            r"─+\s*\nSequential \(parallel=False\)\s*\n─+\s*\n(.*?)(?:\n─+|\n═+|\Z)"
-        ]
-    else:
-        patterns = [
-            r"─+\s*\nParallel Execution\s*\n─+\s*\n(.*?)(?:\n─+|\n═+|\Z)",
-            r"─+\s*\nParallel Execution \(parallel=true\)\s*\n─+\s*\n(.*?)(?:\n─+|\n═+|\Z)",
-            r"─+\s*\nParallel Execution \(parallel=True\)\s*\n─+\s*\n(.*?)(?:\n─+|\n═+|\Z)",
-            r"─+\s*\nParallel \(parallel=true\)\s*\n─+\s*\n(.*?)(?:\n─+|\n═+|\Z)",
-            r"─+\s*\nParallel \(parallel=True\)\s*\n─+\s*\n(.*?)(?:\n─+|\n═+|\Z)"
-        ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, output, re.DOTALL | re.IGNORECASE)
-        if match:
-            content = match.group(1).strip()
-            # Extract just the performance lines (Runtime, Memory, Speedup)
-            perf_lines = []
-            speedup = ""
-            for line in content.split('\n'):
-                line = line.strip()
-                if line.startswith('⏱️') or line.startswith('💾') or line.startswith('⚡'):
-                    if line.startswith('⚡'):
-                        speedup = line
-                    perf_lines.append(line)
-            return '\n'.join(perf_lines), speedup
-    return "", ""
-
-
-def extract_results(output: str) -> str:
+    start = None
+    for title, index in sections.items():
+        match = PERFORMANCE_TITLE_RE.fullmatch(title)
+        if match and match.group(1).lower() == execution_type:
+            start = index
+            break
+
+    # Extract just the performance lines (Runtime, Memory, Speedup)
+    perf_lines = []
+    speedup = ""
+    for line in section_lines(lines, start, ('─', '═')):
+        line = line.strip()
+        kind = PERFORMANCE_LINE_KINDS.get(line[:1])
+        if kind:
+            if kind == "speedup":
+                speedup = line
+            perf_lines.append(line)
+    return '\n'.join(perf_lines), speedup
+
+
+def extract_results(lines: List[str], sections: Dict[str, int]) -> str:
     """Extract results section from output."""
-    # Look for Results section
-    pattern = r"Results\s*─+\s*\n(.*?)(?:\n═+|\Z)"
-    match = re.search(pattern, output, re.DOTALL)
-    if match:
-        content = match.group(1).strip()
-        # Clean up the results section
-        lines = []
-        for line in content.split('\n'):
-            line = line.strip()
-            # Skip empty lines, section separators, and cargo/compiler output
-            if line and not line.startswith('─') and not line.startswith('═'):
-                # Skip cargo build output
-                if not line.startswith('Compiling') and \
-                   not line.startswith('Finished') and \
-                   not line.startswith('Running') and \
-                   not 'target/release' in line:
-                    lines.append(line)
-        return '\n'.join(lines)
-    return ""
+    # The Results section runs until the closing ═ rule
+    results = []
+    for line in section_lines(lines, sections.get("Results"), ('═',)):
+        line = line.strip()
+        # Skip empty lines, section separators, and cargo/compiler output
+        if line and not line.startswith(('─', '═')):
+            # Skip cargo build output
+            if not line.startswith(('Compiling', 'Finished', 'Running')) and \
+               'target/release' not in line:
+                results.append(line)
+    return '\n'.join(results)
 
 
 def parse_example_output(output: str, example_name: str) -> ExampleOutput:
     """Parse example output to extract relevant sections."""
     result = ExampleOutput(example_name)
-    
-    result.mermaid_diagram = extract_mermaid_diagram(output)
-    result.performance_sequential, _ = extract_performance(output, "sequential")
-    result.performance_parallel, result.speedup = extract_performance(output, "parallel")
-    result.results = extract_results(output)
-    
+
+    # Split and index the output once; each extractor then reads only its section
+    lines = output.splitlines()
+    sections = index_sections(lines)
+
+    result.mermaid_diagram = extract_mermaid_diagram(lines, sections)
+    result.performance_sequential, _ = extract_performance(lines, sections, "sequential")
+    result.performance_parallel, result.speedup = extract_performance(lines, sections, "parallel")
+    result.results = extract_results(lines, sections)
+
     return result
 
 
@@ -201,6 +366,7 @@ def build_example_section(
     return section
 
 
+@lru_cache(maxsize=None)
 def get_example_metadata() -> List[Tuple[int, str, str]]:
     """Return metadata for each example: (number, title, description)."""
     return [
@@ -213,6 +379,7 @@ def get_example_metadata() -> List[Tuple[int, str, str]]:
     ]
 
 
+@lru_cache(maxsize=None)
 def get_rust_syntax_blocks() -> Dict[int, str]:
     """Return syntax examples for Rust."""
     return {
@@ -322,6 +489,7 @@ graph.add(consumer_c, Some("ConsumerC"), /* ... */);"""
     }
 
 
+@lru_cache(maxsize=None)
 def get_python_syntax_blocks() -> Dict[int, str]:
     """Return syntax examples for Python."""
     return {
@@ -420,19 +588,25 @@ for branch_id, outputs in result.branch_outputs.items():
     print(f"Branch {branch_id}: {outputs}")""",
         6: """import dagex
 import numpy as np
+from functools import partial
 
-# Create large data
+# Create large data - with share_arrays=True the NumPy array is passed between
+# nodes as the same object
 def create_large_data(_inputs):
-    # Large numpy array - efficiently shared
-    large_array = list(range(1_000_000))
+    large_array = np.arange(1_000_000, dtype=np.int32)
     return {"large_data": large_array}
 
-graph.add(create_large_data, label="CreateLargeData", ...)
+# One consumer function, parameterised by the segment it reads
+def sum_segment(inputs, lo, hi):
+    data = inputs["data"]  # the shared ndarray; slicing is a zero-copy view
+    return {"sum": int(np.add.reduce(data[lo:hi]))}
 
-# Multiple consumers access the same data - minimal copying
-graph.add(consumer_a, label="ConsumerA", ...)
-graph.add(consumer_b, label="ConsumerB", ...)
-graph.add(consumer_c, label="ConsumerC", ...)"""
+graph.add(create_large_data, label="CreateLargeData", share_arrays=True, ...)
+
+# Multiple consumers access the same buffer - no copying
+graph.add(partial(sum_segment, lo=0, hi=1000), label="ConsumerA", ...)
+graph.add(partial(sum_segment, lo=1000, hi=2000), label="ConsumerB", ...)
+graph.add(partial(sum_segment, lo=2000, hi=3000), label="ConsumerC", ...)"""
     }
 
 
@@ -554,18 +728,18 @@ python3 examples/py/06_graphdata_large_payload_arc_or_shared_data.py
 '''
     
     # Build example sections
-    examples_section = ""
+    example_sections = []
     metadata = get_example_metadata()
     syntax_blocks = get_rust_syntax_blocks()
     
     for num, title, description in metadata:
         example_key = f"rs_{num:02d}"
         if example_key in parsed_outputs:
-            examples_section += build_example_section(
+            example_sections.append(build_example_section(
                 num, title, description,
                 syntax_blocks[num], "rust",
                 parsed_outputs[example_key]
-            )
+            ))
     
     # Core API section (preserved from original)
     api_section = '''
@@ -663,7 +837,7 @@ MIT License - see [LICENSE](LICENSE) for details.
 
 <div align="center">Built with ❤️ in Rust — star the repo if you find it useful!</div>'''
     
-    return header + examples_section + api_section
+    return "".join([header, *example_sections, api_section])
 
 
 def generate_readme_pypi(parsed_outputs: Dict[str, ExampleOutput], repo_root: Path) -> str:
@@ -741,18 +915,18 @@ python3 examples/py/06_graphdata_large_payload_arc_or_shared_data.py
 '''
     
     # Build example sections
-    examples_section = ""
+    example_sections = []
     metadata = get_example_metadata()
     syntax_blocks = get_python_syntax_blocks()
     
     for num, title, description in metadata:
         example_key = f"py_{num:02d}"
         if example_key in parsed_outputs:
-            examples_section += build_example_section(
+            example_sections.append(build_example_section(
                 num, title, description,
                 syntax_blocks[num], "python",
                 parsed_outputs[example_key]
-            )
+            ))
     
     # API section for Python
     api_section = '''
@@ -773,6 +947,10 @@ graph.add(
     inputs=[("broadcast", "impl")], # Input mapping
     outputs=[("impl", "broadcast")] # Output mapping
 )
+# inputs/outputs accept a dict, a list of pairs or a tuple of pairs, so
+# mappings can be shared as module-level constants:
+X_TO_IMPL = (("x", "impl"),)
+graph.add(function, label="Reused", inputs=X_TO_IMPL)
 
 # Create branches
 branch_graph = dagex.Graph()
@@ -798,6 +976,17 @@ graph.variants(
     outputs=[("output", "results")]
 )
 
+# Add several nodes in one call: dicts (which may also set "memoize" and
+# "share_arrays"), or (function, label, inputs, outputs) tuples with trailing
+# items optional.
+# A malformed entry (including an unknown dict key) raises ValueError before
+# any node is added; the specs may be given as a list or a tuple.
+graph.add_many([
+    (source, "Source", None, [("value", "x")]),
+    {"function": double, "label": "Double",
+     "inputs": [("x", "x")], "outputs": [("y", "out")]},
+])
+
 # Build and execute
 dag = graph.build()
 context = dag.execute(parallel=False)
@@ -821,6 +1010,23 @@ def my_node(inputs):
     }
 ```
 
+NumPy arrays returned by a node are converted to lists like any other
+sequence. A node added with `share_arrays=True` instead passes its arrays
+(anything exposing `__array_interface__`) on unconverted: the same ndarray
+object is handed to downstream nodes and returned by `dag.execute()`. This
+avoids an element-wise copy of large payloads, but:
+
+- consumers receive an ndarray, so use array idioms (`a.size`,
+  `np.concatenate`) rather than list ones (`if a:`, `+`, `.append`);
+- every consumer shares one mutable buffer, and nodes in the same parallel
+  level may run concurrently, so never modify a shared array in place
+  (`a += 1`) - copy it first;
+- `memoize=True` consumers never get a cache hit on a shared array.
+
+`dag.predict()` still expands a 1-D array output into per-element columns
+(`name[0]`, `name[1]`, ...), and nodes downstream of it in a prediction
+receive a plain list.
+
 ### Execution
 
 ```python
@@ -849,11 +1055,24 @@ MIT License
 - **Repository:** https://github.com/briday1/graph-sp
 - **Rust Crate:** https://crates.io/crates/dagex'''
     
-    return header + examples_section + api_section
+    return "".join([header, *example_sections, api_section])
 
 
 def main():
     """Main script execution."""
+    parser = argparse.ArgumentParser(description="Build README files from demo outputs.")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="re-run every example instead of reusing cached outputs"
+    )
+    parser.add_argument(
+        "--force-install",
+        action="store_true",
+        help="reinstall the Python package even if the in-tree build looks current"
+    )
+    args = parser.parse_args()
+
     print("═" * 60)
     print("  Building READMEs from Demo Outputs")
     print("═" * 60)
@@ -866,67 +1085,79 @@ def main():
     
     # Collect all outputs
     parsed_outputs: Dict[str, ExampleOutput] = {}
+
+    # Parsed outputs are reused while the example and library sources are unchanged
+    cache_path = repo_root / ".build_readme_cache.json"
+    cache = {} if args.no_cache else load_cache(cache_path)
+    stamp = library_stamp(repo_root)
     
     # Run Rust examples
     print("Running Rust examples...")
     print("─" * 60)
-    for i in range(1, 7):
-        example_name = [
-            "01_minimal_pipeline",
-            "02_parallel_vs_sequential",
-            "03_branch_and_merge",
-            "04_variants_sweep",
-            "05_output_access",
-            "06_graphdata_large_payload_arc_or_shared_data"
-        ][i - 1]
-        
-        output = run_rust_example(example_name, repo_root)
-        if output:
-            parsed = parse_example_output(output, example_name)
-            parsed_outputs[f"rs_{i:02d}"] = parsed
+    rust_runs = []
+    for i, example_name in enumerate(EXAMPLE_NAMES, start=1):
+        source = repo_root / "examples" / "rs" / f"{example_name}.rs"
+        fingerprint = f"{source.stat().st_mtime_ns if source.exists() else 0}:{stamp}"
+        rust_runs.append((f"rs_{i:02d}", example_name, fingerprint))
+
+    # Compile up front so each timed run below starts without a build step,
+    # unless every run will come from the cache. The runs themselves stay
+    # sequential: their timings end up in the README.
+    if not all(is_cached(cache, key, fingerprint) for key, _, fingerprint in rust_runs):
+        build_rust_examples(repo_root)
+    for key, example_name, fingerprint in rust_runs:
+        parsed = run_or_load(
+            cache, key, fingerprint, example_name,
+            lambda: run_rust_example(example_name, repo_root)
+        )
+        if parsed:
+            parsed_outputs[key] = parsed
     
     print()
     
     # Setup Python environment first
     print("Setting up Python environment...")
     print("─" * 60)
-    try:
-        # Install the package in development mode
-        subprocess.run(
-            ["pip", "install", "-e", "."],
-            cwd=repo_root,
-            check=True,
-            capture_output=True
-        )
-        print("  Python package installed successfully")
-    except subprocess.CalledProcessError as e:
-        print(f"  Warning: Failed to install Python package: {e}")
-        print("  Python examples may fail")
+    if not args.force_install and python_extension_is_current(repo_root):
+        print("  Python package is up to date, skipping install")
+    else:
+        try:
+            # Install the package in development mode
+            subprocess.run(
+                [sys.executable, "-m", "pip", "install", "-e", ".[examples]"],
+                cwd=repo_root,
+                check=True,
+                capture_output=True
+            )
+            print("  Python package installed successfully")
+        except subprocess.CalledProcessError as e:
+            print(f"  Warning: Failed to install Python package: {e}")
+            print("  Python examples may fail")
     
     print()
     
     # Run Python examples
     print("Running Python examples...")
     print("─" * 60)
-    for i in range(1, 7):
-        example_name = [
-            "01_minimal_pipeline",
-            "02_parallel_vs_sequential",
-            "03_branch_and_merge",
-            "04_variants_sweep",
-            "05_output_access",
-            "06_graphdata_large_payload_arc_or_shared_data"
-        ][i - 1]
-        
+    # Unlike the Rust examples, these also depend on the interpreter and on
+    # the benchmark_utils environment switches
+    settings = python_run_settings()
+    for i, example_name in enumerate(EXAMPLE_NAMES, start=1):
         example_file = repo_root / "examples" / "py" / f"{example_name}.py"
         if example_file.exists():
-            output = run_python_example(example_file, repo_root)
-            if output:
-                parsed = parse_example_output(output, example_name)
-                parsed_outputs[f"py_{i:02d}"] = parsed
+            key = f"py_{i:02d}"
+            fingerprint = f"{example_file.stat().st_mtime_ns}:{stamp}:{settings}"
+            parsed = run_or_load(
+                cache, key, fingerprint, example_name,
+                lambda: run_python_example(example_file, repo_root)
+            )
+            if parsed:
+                parsed_outputs[key] = parsed
     
     print()
     
+    save_cache(cache_path, cache)
+
     # Generate READMEs
     print("Generating README files...")
     print("─" * 60)
@@ -80,5 +80,187 @@ assert cov.shape == (2, 2)
 assert cov[0, 0] > 0  # Var(a)
 print(f"\n  5. covariance_matrix shape={cov.shape}  Var(a)={cov[0,0]:.3f}  Cov(a,b)={cov[0,1]:.3f}  ✓")
 
+# ── 6. share_arrays: ndarray outputs pass through execute() unconverted ───────
+payload = np.arange(5, dtype=np.int32)
+seen = {}
+
+
+def consume(inputs):
+    seen["data"] = inputs["data"]
+    return {"total": int(inputs["data"].sum())}
+
+
+g6 = dagex.Graph()
+g6.add(lambda _: {"data": payload}, label="array_source", outputs=[("data", "data")],
+       share_arrays=True)
+g6.add(consume, label="consume", inputs=[("data", "data")], outputs=[("total", "total")])
+ctx6 = g6.build().execute()
+assert seen["data"] is payload, f"consumer got a copy: {type(seen['data'])}"
+assert ctx6["data"] is payload, f"context holds a copy: {type(ctx6['data'])}"
+assert ctx6["total"] == 10
+# Without share_arrays an ndarray output is converted to a list, as before
+g6b = dagex.Graph()
+g6b.add(lambda _: {"data": payload}, label="array_source", outputs=[("data", "data")])
+ctx6b = g6b.build().execute()
+assert isinstance(ctx6b["data"], list) and ctx6b["data"] == [0, 1, 2, 3, 4], ctx6b["data"]
+g6c = dagex.Graph()
+g6c.add_many([{"function": lambda _: {"data": payload}, "label": "array_source",
+               "outputs": [("data", "data")], "share_arrays": True}])
+assert g6c.build().execute()["data"] is payload, "add_many ignored share_arrays"
+print(f"\n  6. ndarray passed by reference: total={ctx6['total']}  ✓")
+
+# ── 7. predict() expands ndarray outputs into element columns ─────────────────
+g7 = dagex.Graph()
+g7.add(  # deterministic node → expand_gd_deterministic
+    lambda _: {"w": np.array([1.0, 2.0, 3.0])},
+    label="array_weights",
+    outputs=[("w", "w")],
+    share_arrays=True,
+)
+g7.add(  # stochastic node → expand_gd_stochastic
+    lambda ctx: {"v": np.full(3, ctx["x"])},
+    label="array_noise",
+    inputs=[("x", "x")],
+    outputs=[("v", "v")],
+    share_arrays=True,
+)
+stat7 = g7.build().predict({"x": dagex.normal(0.0, 1.0)}, n_samples=100)
+part7 = stat7.particles[0]
+assert part7["__veclen__w"] == 3.0 and part7["w[2]"] == 3.0, f"w not expanded: {sorted(part7)}"
+assert part7["__veclen__v"] == 3.0 and part7["v[0]"] == part7["v[2]"], f"v not expanded: {sorted(part7)}"
+print(f"  7. predict expanded ndarray outputs: w[2]={part7['w[2]']:.1f}  v[0]={part7['v[0]']:.3f}  ✓")
+
+# ── 8. memoize: hits, misses, unhashable inputs and the capacity clear ────────
+state = {"x": 1}
+calls = {"square": 0, "opaque": 0, "cube": 0}
+
+
+class Token:
+    """Opaque input: stays a PyObject, so memoized nodes must not cache it."""
+
+
+def square(inputs):
+    calls["square"] += 1
+    return {"y": inputs["x"] ** 2}
+
+
+def opaque(inputs):
+    calls["opaque"] += 1
+    return {"ok": 1}
+
+
+def cube(inputs):
+    calls["cube"] += 1
+    return {"z": inputs["x"] ** 3}
+
+
+g8 = dagex.Graph()
+g8.add(lambda _: {"x": state["x"], "token": Token()}, label="x_source",
+       outputs=[("x", "x"), ("token", "token")])
+g8.add(square, label="square", inputs=[("x", "x")], outputs=[("y", "y")], memoize=True)
+g8.add(opaque, label="opaque", inputs=[("token", "token")], outputs=[("ok", "ok")], memoize=True)
+g8.add_many([{"function": cube, "label": "cube", "inputs": [("x", "x")],
+              "outputs": [("z", "z")], "memoize": True}])
+dag8 = g8.build()
+
+dag8.execute()
+ctx8 = dag8.execute()
+assert calls == {"square": 1, "opaque": 2, "cube": 1}, f"expected hits: {calls}"
+assert ctx8["y"] == 1 and ctx8["z"] == 1
+state["x"] = 2
+ctx8 = dag8.execute()
+assert calls["square"] == 2 and ctx8["y"] == 4, f"expected a miss: {calls}"
+state["x"] = 1
+dag8.execute()
+assert calls["square"] == 2, f"x=1 should still be cached: {calls}"
+# 130 more distinct inputs push the cache past its 128-entry capacity, which clears it
+for value in range(100, 230):
+    state["x"] = value
+    dag8.execute()
+state["x"] = 1
+before = calls["square"]
+dag8.execute()
+assert calls["square"] == before + 1, "cache should have been cleared at capacity"
+# A call that raises is reported but not cached, so the next run retries it
+flaky = {"calls": 0}
+
+
+def flaky_double(inputs):
+    flaky["calls"] += 1
+    if flaky["calls"] == 1:
+        raise RuntimeError("transient failure (expected traceback)")
+    return {"y": inputs["x"] * 2}
+
+
+g8b = dagex.Graph()
+g8b.add(lambda _: {"x": 4}, label="x_source", outputs=[("x", "x")])
+g8b.add(flaky_double, label="flaky", inputs=[("x", "x")], outputs=[("y", "y")], memoize=True)
+dag8b = g8b.build()
+assert "y" not in dag8b.execute(), "a failed call produced outputs"
+assert dag8b.execute()["y"] == 8, "the failed call was cached"
+assert dag8b.execute()["y"] == 8 and flaky["calls"] == 2, f"success not cached: {flaky}"
+print(f"\n  8. memoize calls after {4 + 130 + 1} runs: {calls}  ✓")
+
+# ── 9. add_many: dict and tuple specs, None fields, malformed entries ─────────
+g9 = dagex.Graph()
+g9.add_many([
+    # tuple form, all four fields
+    (lambda _: {"v": 3}, "Source", None, [("v", "v")]),
+    # dict form
+    {"function": lambda ctx: {"w": ctx["v"] * 2}, "label": "Double",
+     "inputs": [("v", "v")], "outputs": [("w", "w")]},
+    # tuple form with trailing fields omitted
+    (lambda _: {}, "LabelOnly"),
+    # explicit None fields → no-op node
+    (None, "Placeholder", None, None),
+    {"function": None, "label": "DictPlaceholder", "inputs": None, "outputs": None},
+])
+dag9 = g9.build()
+assert dag9.node_count() == 5, f"expected 5 nodes, got {dag9.node_count()}"
+assert dag9.node_labels() == ["DictPlaceholder", "Double", "LabelOnly", "Placeholder", "Source"]
+assert dag9.execute()["w"] == 6
+
+# a wrong-length tuple or a dict with an unknown (e.g. misspelt) key is rejected
+for bad in [(), (None, "a", None, None, None), {"label": "Typo", "input": [("v", "v")]}]:
+    g9b = dagex.Graph()
+    g9b.add(lambda _: {"v": 1}, label="Existing", outputs=[("v", "v")])
+    try:
+        # the valid first entry must not be added when a later one is malformed
+        g9b.add_many([(lambda _: {}, "Valid"), bad])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError(f"add_many accepted {bad!r}")
+    assert g9b.build().node_labels() == ["Existing"], "malformed add_many modified the graph"
+# any sequence of specs is accepted, not only a list
+g9c = dagex.Graph()
+g9c.add_many(((lambda _: {"v": 1}, "A", None, [("v", "v")]), (None, "B")))
+assert g9c.build().node_labels() == ["A", "B"]
+print(f"\n  9. add_many nodes: {dag9.node_labels()}  ✓")
+
+# ── 10. inputs/outputs as a tuple of pairs ────────────────────────────────────
+SOURCE_OUT = (("v", "v"),)
+DOUBLE_IN = (("v", "v"),)
+DOUBLE_OUT = (("w", "w"),)
+g10 = dagex.Graph()
+g10.add(lambda _: {"v": 5}, label="Source", outputs=SOURCE_OUT)
+g10.add(lambda ctx: {"w": ctx["v"] * 2}, label="Double", inputs=DOUBLE_IN, outputs=DOUBLE_OUT)
+g10.variants([lambda ctx: {"z": ctx["w"] + 1}], label="Inc", inputs=(("w", "w"),), outputs=(("z", "z"),))
+g10.add_many([(lambda ctx: {"t": ctx["z"] * 10}, "Tens", (("z", "z"),), (("t", "t"),))])
+ctx10 = g10.build().execute()
+assert (ctx10["w"], ctx10["z"], ctx10["t"]) == (10, 11, 110), f"unexpected context: {ctx10}"
+# tuples and lists of pairs are interchangeable with the list form
+g10b = dagex.Graph()
+g10b.add(lambda _: {"v": 5}, label="Source", outputs=[("v", "v")])
+g10b.add(lambda ctx: {"w": ctx["v"] * 2}, label="Double", inputs=[("v", "v")], outputs=[("w", "w")])
+assert g10b.build().execute()["w"] == ctx10["w"]
+try:
+    dagex.Graph().add(lambda _: {}, label="Bad", outputs=(("v",),))
+except (ValueError, TypeError):
+    pass
+else:
+    raise AssertionError("a tuple holding a 1-item pair was accepted")
+print(f"\n  10. tuple-of-pairs mappings: w={ctx10['w']} z={ctx10['z']} t={ctx10['t']}  ✓")
+
 print("\n  ══════════════════════════════════════════════")
 print("  All smoke tests passed  ✓")
@@ -5,7 +5,8 @@ use crate::graph_data::GraphData;
 use crate::node::{Node, NodeId};
 use crate::stat_result::StatResult;
 use std::collections::{HashMap, HashSet, VecDeque};
-use std::sync::{Arc, Mutex};
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::{Arc, OnceLock};
 
 /// Execution context for storing variable values during graph execution
 pub type ExecutionContext = HashMap<String, GraphData>;
@@ -96,6 +97,12 @@ pub struct Dag {
     execution_order: Vec<NodeId>,
     /// Levels for parallel execution (nodes at same level can run in parallel)
     execution_levels: Vec<Vec<NodeId>>,
+    /// Position of each node in `nodes`, keyed by node ID
+    node_index: HashMap<NodeId, usize>,
+    /// Context lookup plan of each node, parallel to `nodes` (see `Node::input_lookup`)
+    input_lookups: Vec<Vec<(String, String)>>,
+    /// Rendered Mermaid diagram, built on first `to_mermaid()` call
+    mermaid: OnceLock<String>,
 }
 
 impl Dag {
@@ -106,16 +113,38 @@ impl Dag {
     /// - Determines optimal execution order
     /// - Identifies parallelizable operations
     pub fn new(nodes: Vec<Node>) -> Self {
+        let node_index: HashMap<NodeId, usize> = nodes
+            .iter()
+            .enumerate()
+            .map(|(idx, node)| (node.id, idx))
+            .collect();
         let execution_order = Self::topological_sort(&nodes);
-        let execution_levels = Self::compute_execution_levels(&nodes, &execution_order);
+        let execution_levels =
+            Self::compute_execution_levels(&nodes, &node_index, &execution_order);
+        // The DAG owns its nodes immutably, so their input mappings can be
+        // resolved once here rather than on every execution
+        let input_lookups = nodes.iter().map(Node::input_lookup).collect();
 
         Self {
             nodes,
             execution_order,
             execution_levels,
+            node_index,
+            input_lookups,
+            mermaid: OnceLock::new(),
         }
     }
 
+    /// Look up a node by ID
+    fn node(&self, node_id: NodeId) -> Option<&Node> {
+        self.node_index.get(&node_id).map(|&idx| &self.nodes[idx])
+    }
+
+    /// Execute one of this DAG's nodes using its precomputed input lookup
+    fn execute_node(&self, node: &Node, context: &ExecutionContext) -> HashMap<String, GraphData> {
+        node.execute_with_lookup(&self.input_lookups[self.node_index[&node.id]], context)
+    }
+
     /// Perform topological sort to determine execution order
     fn topological_sort(nodes: &[Node]) -> Vec<NodeId> {
         let mut in_degree: HashMap<NodeId, usize> = HashMap::new();
@@ -163,12 +192,16 @@ impl Dag {
     ///
     /// Nodes at the same level have no dependencies on each other and can
     /// execute in parallel.
-    fn compute_execution_levels(nodes: &[Node], execution_order: &[NodeId]) -> Vec<Vec<NodeId>> {
+    fn compute_execution_levels(
+        nodes: &[Node],
+        node_index: &HashMap<NodeId, usize>,
+        execution_order: &[NodeId],
+    ) -> Vec<Vec<NodeId>> {
         let mut levels: Vec<Vec<NodeId>> = Vec::new();
-        let mut node_level: HashMap<NodeId, usize> = HashMap::new();
+        let mut node_level: HashMap<NodeId, usize> = HashMap::with_capacity(nodes.len());
 
         for &node_id in execution_order {
-            let node = nodes.iter().find(|n| n.id == node_id).unwrap();
+            let node = &nodes[node_index[&node_id]];
 
             // Find the maximum level of all dependencies
             let level = if node.dependencies.is_empty() {
@@ -214,12 +247,18 @@ impl Dag {
     /// * `max_threads` - Optional maximum number of threads to use per level (None = unlimited)
     pub fn execute_detailed(&self, parallel: bool, max_threads: Option<usize>) -> ExecutionResult {
         let mut result = ExecutionResult::new();
+        result.node_outputs.reserve(self.nodes.len());
+        // Upper bound on context keys: branch nodes write prefixed keys, while
+        // variants and sibling nodes may overwrite the same broadcast key
+        result
+            .context
+            .reserve(self.nodes.iter().map(|n| n.output_mapping.len()).sum());
 
         if !parallel {
             // Sequential execution
             for &node_id in &self.execution_order {
-                if let Some(node) = self.nodes.iter().find(|n| n.id == node_id) {
-                    let outputs = node.execute(&result.context);
+                if let Some(node) = self.node(node_id) {
+                    let outputs = self.execute_node(node, &result.context);
 
                     // Store outputs in global context
                     // For branch nodes, prefix keys with branch_id to avoid conflicts
@@ -252,8 +291,8 @@ impl Dag {
                 if level.len() == 1 {
                     // Single node - no need for threading overhead
                     let node_id = level[0];
-                    if let Some(node) = self.nodes.iter().find(|n| n.id == node_id) {
-                        let outputs = node.execute(&result.context);
+                    if let Some(node) = self.node(node_id) {
+                        let outputs = self.execute_node(node, &result.context);
 
                         // For branch nodes, prefix keys to avoid conflicts
                         if let Some(branch_id) = node.branch_id {
@@ -276,63 +315,84 @@ impl Dag {
                         }
                     }
                 } else {
-                    // Multiple nodes - execute in parallel using scoped threads
-                    let context = Arc::new(result.context.clone());
+                    // Multiple nodes - execute in parallel using scoped threads.
+                    // Scoped threads can borrow the context directly, so the level
+                    // does not need its own copy of it.
+                    let context = &result.context;
                     let nodes_to_execute: Vec<_> = level
                         .iter()
-                        .filter_map(|&node_id| self.nodes.iter().find(|n| n.id == node_id))
+                        .filter_map(|&node_id| self.node(node_id))
                         .collect();
 
-                    // Limit threads if max_threads is specified
-                    let chunk_size = if let Some(max) = max_threads {
-                        max.max(1) // At least 1 thread
-                    } else {
-                        nodes_to_execute.len() // Unlimited - one thread per node
-                    };
-
-                    let outputs = Arc::new(Mutex::new(Vec::new()));
-
-                    // Process nodes in chunks to respect max_threads limit
-                    for chunk in nodes_to_execute.chunks(chunk_size) {
-                        std::thread::scope(|s| {
-                            for node in chunk {
-                                let context = Arc::clone(&context);
-                                let outputs = Arc::clone(&outputs);
-
+                    // Spawn at most max_threads workers for the level. Each one pulls
+                    // the next unclaimed node, so a slow node no longer holds back a
+                    // whole chunk of threads.
+                    let worker_count = max_threads
+                        .map(|max| max.max(1)) // At least 1 thread
+                        .unwrap_or(nodes_to_execute.len()) // Unlimited - one thread per node
+                        .min(nodes_to_execute.len());
+                    let next_node = AtomicUsize::new(0);
+
+                    let mut level_outputs: Vec<Option<HashMap<String, GraphData>>> =
+                        vec![None; nodes_to_execute.len()];
+
+                    let next_node = &next_node;
+                    let nodes_ref = &nodes_to_execute;
+                    std::thread::scope(|s| {
+                        let handles: Vec<_> = (0..worker_count)
+                            .map(|_| {
                                 s.spawn(move || {
-                                    let node_outputs = node.execute(&context);
-                                    outputs.lock().unwrap().push((
-                                        node.id,
-                                        node.branch_id,
-                                        node_outputs,
-                                    ));
-                                });
+                                    let mut done = Vec::new();
+                                    loop {
+                                        let idx = next_node.fetch_add(1, Ordering::Relaxed);
+                                        match nodes_ref.get(idx) {
+                                            Some(node) => {
+                                                done.push((idx, self.execute_node(node, context)))
+                                            }
+                                            None => break,
+                                        }
+                                    }
+                                    done
+                                })
+                            })
+                            .collect();
+
+                        for handle in handles {
+                            for (idx, outputs) in handle.join().unwrap() {
+                                level_outputs[idx] = Some(outputs);
                             }
+                        }
+                    });
+
+                    // Merge in level order so results don't depend on thread timing
+                    let collected_outputs = nodes_to_execute
+                        .iter()
+                        .zip(level_outputs)
+                        .filter_map(|(node, outputs)| {
+                            outputs.map(|outputs| (node.id, node.branch_id, outputs))
                         });
-                    }
 
                     // Collect outputs from all parallel executions
-                    let collected_outputs = outputs.lock().unwrap();
-                    for (node_id, branch_id, node_outputs) in collected_outputs.iter() {
+                    for (node_id, branch_id, node_outputs) in collected_outputs {
                         // For branch nodes, prefix keys to avoid conflicts
                         if let Some(bid) = branch_id {
-                            for (key, value) in node_outputs {
+                            for (key, value) in &node_outputs {
                                 let prefixed_key = format!("__branch_{}__{}",  bid, key);
                                 result.context.insert(prefixed_key, value.clone());
                             }
                         } else {
                             result.context.extend(node_outputs.clone());
                         }
-                        
-                        result.node_outputs.insert(*node_id, node_outputs.clone());
 
                         if let Some(bid) = branch_id {
                             result
                                 .branch_outputs
-                                .entry(*bid)
+                                .entry(bid)
                                 .or_default()
                                 .extend(node_outputs.clone());
                         }
+
+                        result.node_outputs.insert(node_id, node_outputs);
                     }
                 }
             }
@@ -345,7 +405,15 @@ impl Dag {
     ///
     /// Returns a string containing a Mermaid flowchart representing the DAG.
     /// Edge labels show port mappings (broadcast_var → impl_var).
+    ///
+    /// The DAG is immutable once built, so the diagram is rendered once and
+    /// reused by later calls.
     pub fn to_mermaid(&self) -> String {
+        self.mermaid.get_or_init(|| self.render_mermaid()).clone()
+    }
+
+    /// Render the Mermaid diagram backing `to_mermaid()`
+    fn render_mermaid(&self) -> String {
         let mut mermaid = String::from("graph TD\n");
 
         // Add all nodes
@@ -361,7 +429,7 @@ impl Dag {
                 let edge = (dep_id, node.id);
                 if !edges_added.contains(&edge) {
                     // Find the dependency node to get its output mappings
-                    let dep_node = self.nodes.iter().find(|n| n.id == dep_id);
+                    let dep_node = self.node(dep_id);
 
                     // Build port mapping label
                     let mut port_labels = Vec::new();
@@ -475,7 +543,7 @@ impl Dag {
         let mut satisfied: HashSet<NodeId> = HashSet::new();
 
         for &node_id in &self.execution_order {
-            let node = match self.nodes.iter().find(|n| n.id == node_id) {
+            let node = match self.node(node_id) {
                 Some(n) => n,
                 None => continue,
             };
@@ -505,7 +573,7 @@ impl Dag {
             {
                 // All inputs known — run once, wrap outputs as Deterministic
                 let mini = Self::build_mini_ctx(node, &dist_ctx, None::<&mut rand::rngs::ThreadRng>);
-                node.execute(&mini)
+                self.execute_node(node, &mini)
                     .into_iter()
                     .filter_map(|(k, v)| gd_to_f64(&v).map(|f| (k, Distribution::deterministic(f))))
                     .collect()
@@ -518,7 +586,7 @@ impl Dag {
                 let mut sample_vecs: HashMap<String, Vec<f64>> = HashMap::new();
                 for _ in 0..n {
                     let mini = Self::build_mini_ctx(node, &dist_ctx, Some(&mut rng));
-                    for (k, v) in node.execute(&mini) {
+                    for (k, v) in self.execute_node(node, &mini) {
                         if let Some(f) = gd_to_f64(&v) {
                             sample_vecs.entry(k).or_default().push(f);
                         }
@@ -619,7 +687,7 @@ impl Dag {
         let mut stat = StatResult::new();
 
         for &node_id in &self.execution_order {
-            let node = match self.nodes.iter().find(|n| n.id == node_id) {
+            let node = match self.node(node_id) {
                 Some(n) => n,
                 None => continue,
             };
@@ -647,7 +715,7 @@ impl Dag {
                     &dist_ctx,
                     None::<&mut rand::rngs::ThreadRng>,
                 );
-                for (broadcast_var, gd) in node.execute(&mini) {
+                for (broadcast_var, gd) in self.execute_node(node, &mini) {
                     expand_gd_deterministic(&broadcast_var, &gd, n_samples, &mut output_cols);
                 }
             } else {
@@ -669,7 +737,7 @@ impl Dag {
                         }
                     }
 
-                    for (broadcast_var, gd) in node.execute(&mini) {
+                    for (broadcast_var, gd) in self.execute_node(node, &mini) {
                         expand_gd_stochastic(&broadcast_var, &gd, &mut output_cols);
                     }
                 }
@@ -865,7 +933,11 @@ fn expand_gd_deterministic(
                 output_cols.insert(format!("{}[{}]", broadcast_var, idx), vec![val as f64; n_samples]);
             }
         }
-        _ => {}
+        _ => {
+            if let Some(v) = gd.as_py_float_vec() {
+                expand_gd_deterministic(broadcast_var, &GraphData::float_vec(v), n_samples, output_cols);
+            }
+        }
     }
 }
 
@@ -911,7 +983,11 @@ fn expand_gd_stochastic(
                     .push(val as f64);
             }
         }
-        _ => {}
+        _ => {
+            if let Some(v) = gd.as_py_float_vec() {
+                expand_gd_stochastic(broadcast_var, &GraphData::float_vec(v), output_cols);
+            }
+        }
     }
 }
 
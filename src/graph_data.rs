@@ -146,6 +146,19 @@ impl GraphData {
         }
     }
 
+    /// Try to extract a Python sequence (e.g. a NumPy array kept as an opaque
+    /// `PyObject`) as `Vec<f64>`.  Used by `Dag::predict()` so vector outputs
+    /// behave the same whether a node returned a list or an array.
+    pub fn as_py_float_vec(&self) -> Option<Vec<f64>> {
+        match self {
+            #[cfg(feature = "python")]
+            GraphData::PyObject(obj) => {
+                pyo3::Python::with_gil(|py| obj.extract::<Vec<f64>>(py).ok())
+            }
+            _ => None,
+        }
+    }
+
     /// Try to extract as String reference
     pub fn as_string(&self) -> Option<&str> {
         match self {
@@ -72,45 +72,62 @@ impl Node {
         }
     }
 
-    /// Execute this node with the given context
-    pub fn execute(&self, context: &HashMap<String, GraphData>) -> HashMap<String, GraphData> {
-        // Map broadcast context vars to impl vars using input_mapping
-        // input_mapping: broadcast_var -> impl_var
-        // Special case: For merge nodes, broadcast_var may be "branch_id:var_name"
-        let inputs: HashMap<String, GraphData> = self
-            .input_mapping
+    /// Resolve each broadcast key in `input_mapping` to the key it is stored
+    /// under in the execution context, as (context_key, impl_var) pairs.
+    ///
+    /// Special case: for merge nodes the broadcast key is "branch_id:var_name",
+    /// which branch nodes write to the context as "__branch_{id}__{var}".
+    /// Malformed merge keys (more than one ':') can never resolve and are dropped.
+    pub(crate) fn input_lookup(&self) -> Vec<(String, String)> {
+        self.input_mapping
             .iter()
             .filter_map(|(broadcast_key, impl_var)| {
-                // Handle merge node special format: "branch_id:broadcast_var"
                 if broadcast_key.contains(':') {
-                    // Parse "branch_id:var_name" and look for "__branch_{id}__{var}"
                     let parts: Vec<&str> = broadcast_key.split(':').collect();
                     if parts.len() == 2 {
-                        let prefixed_key = format!("__branch_{}__{}",  parts[0], parts[1]);
-                        context
-                            .get(&prefixed_key)
-                            .map(|val| (impl_var.clone(), val.clone()))
+                        Some((format!("__branch_{}__{}", parts[0], parts[1]), impl_var.clone()))
                     } else {
                         None
                     }
                 } else {
-                    // Normal case: direct lookup
-                    context
-                        .get(broadcast_key)
-                        .map(|val| (impl_var.clone(), val.clone()))
+                    Some((broadcast_key.clone(), impl_var.clone()))
                 }
             })
-            .collect();
+            .collect()
+    }
+
+    /// Execute this node with the given context
+    pub fn execute(&self, context: &HashMap<String, GraphData>) -> HashMap<String, GraphData> {
+        self.execute_with_lookup(&self.input_lookup(), context)
+    }
+
+    /// Execute this node using a lookup plan precomputed by `input_lookup()`
+    ///
+    /// `Dag` resolves every node's plan once when it is built, so repeated
+    /// executions do no string work on the input keys.
+    pub(crate) fn execute_with_lookup(
+        &self,
+        input_lookup: &[(String, String)],
+        context: &HashMap<String, GraphData>,
+    ) -> HashMap<String, GraphData> {
+        // Map broadcast context vars to impl vars using the lookup plan
+        let mut inputs: HashMap<String, GraphData> = HashMap::with_capacity(input_lookup.len());
+        for (context_key, impl_var) in input_lookup {
+            if let Some(val) = context.get(context_key) {
+                inputs.insert(impl_var.clone(), val.clone());
+            }
+        }
 
         // Execute function with inputs
-        let func_outputs = (self.function)(&inputs);
+        let mut func_outputs = (self.function)(&inputs);
 
         // Map function outputs to broadcast vars using output_mapping
         // output_mapping: impl_var -> broadcast_var
-        let mut context_outputs = HashMap::new();
+        // The function's outputs are owned, so values are moved rather than cloned
+        let mut context_outputs = HashMap::with_capacity(self.output_mapping.len());
         for (impl_var, broadcast_var) in &self.output_mapping {
-            if let Some(value) = func_outputs.get(impl_var) {
-                context_outputs.insert(broadcast_var.clone(), value.clone());
+            if let Some(value) = func_outputs.remove(impl_var) {
+                context_outputs.insert(broadcast_var.clone(), value);
             }
         }
 
@@ -7,9 +7,11 @@ use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 #[cfg(feature = "radar_examples")]
 use pyo3::types::PyComplex;
-use pyo3::types::{PyDict, PyList};
+use pyo3::types::{PyDict, PyList, PyTuple};
+use std::collections::hash_map::DefaultHasher;
 use std::collections::HashMap;
-use std::sync::Arc;
+use std::hash::{Hash, Hasher};
+use std::sync::{Arc, Mutex};
 
 use crate::builder::Graph;
 use crate::dag::{Dag, PredictTarget};
@@ -223,83 +225,100 @@ impl PyGraph {
     /// Args:
     ///     function: Optional Python callable. If None, creates a no-op node.
     ///     label: Optional string label for the node
-    ///     inputs: Optional list of (broadcast_var, impl_var) tuples or dict
-    ///     outputs: Optional list of (impl_var, broadcast_var) tuples or dict
+    ///     inputs: Optional list or tuple of (broadcast_var, impl_var) pairs, or dict
+    ///     outputs: Optional list or tuple of (impl_var, broadcast_var) pairs, or dict
+    ///     memoize: If True, cache the function's outputs keyed on its inputs so
+    ///         repeated executions with identical inputs skip the Python call.
+    ///         Only use this for pure functions. Inputs that cannot be hashed
+    ///         (opaque Python objects) always fall through to a direct call.
+    ///     share_arrays: If True, NumPy arrays (anything exposing
+    ///         ``__array_interface__``) returned by the function are passed on
+    ///         as the same object instead of being converted to a list. Every
+    ///         consumer then shares one mutable buffer, so consumers must not
+    ///         modify it in place, and memoized consumers never hit on it.
     ///
     /// Returns:
     ///     Self for method chaining
-    #[pyo3(signature = (function=None, label=None, inputs=None, outputs=None))]
+    #[pyo3(signature = (function=None, label=None, inputs=None, outputs=None, memoize=false, share_arrays=false))]
     fn add(
         &mut self,
         function: Option<PyObject>,
         label: Option<String>,
         inputs: Option<&PyAny>,
         outputs: Option<&PyAny>,
+        memoize: bool,
+        share_arrays: bool,
     ) -> PyResult<()> {
         let graph = self
             .graph
             .as_mut()
             .ok_or_else(|| PyValueError::new_err("Graph has already been built or consumed"))?;
 
-        // Parse inputs
-        let input_vec = if let Some(inp) = inputs {
-            parse_mapping(inp)?
-        } else {
-            Vec::new()
-        };
-
-        // Parse outputs
-        let output_vec = if let Some(out) = outputs {
-            parse_mapping(out)?
-        } else {
-            Vec::new()
-        };
-
-        // Convert to references for the add method
-        let input_refs: Vec<(&str, &str)> = input_vec
-            .iter()
-            .map(|(a, b)| (a.as_str(), b.as_str()))
-            .collect();
-        let output_refs: Vec<(&str, &str)> = output_vec
-            .iter()
-            .map(|(a, b)| (a.as_str(), b.as_str()))
-            .collect();
+        let input_vec = parse_optional_mapping(inputs)?;
+        let output_vec = parse_optional_mapping(outputs)?;
+        add_python_node(
+            graph,
+            function,
+            label.as_deref(),
+            &input_vec,
+            &output_vec,
+            PyNodeOptions {
+                memoize,
+                share_arrays,
+            },
+        );
+        Ok(())
+    }
 
-        // Create the node function
-        if let Some(py_func) = function {
-            // Wrap Python callable in a Rust closure - graph.add will handle Arc wrapping
-            let rust_function = create_python_node_function(py_func);
+    /// Add several nodes to the graph in a single call
+    ///
+    /// Equivalent to calling `add()` once per entry, but crosses the
+    /// Python/Rust boundary only once.
+    ///
+    /// Args:
+    ///     nodes: List or tuple of node specs. Each spec is either a dict with the keys
+    ///         ``function``, ``label``, ``inputs``, ``outputs``, ``memoize`` and
+    ///         ``share_arrays`` (all optional), or a tuple
+    ///         ``(function, label, inputs, outputs)`` where trailing items may
+    ///         be omitted. ``memoize`` and ``share_arrays`` are only available
+    ///         in the dict form.
+    ///
+    /// Example:
+    ///     graph.add_many([
+    ///         (source, "Source", None, [("value", "x")]),
+    ///         {"function": double, "label": "Double",
+    ///          "inputs": [("x", "x")], "outputs": [("y", "out")]},
+    ///     ])
+    fn add_many(&mut self, nodes: &PyAny) -> PyResult<()> {
+        let graph = self
+            .graph
+            .as_mut()
+            .ok_or_else(|| PyValueError::new_err("Graph has already been built or consumed"))?;
+        let specs: Vec<&PyAny> = nodes.extract().map_err(|_| {
+            PyValueError::new_err("add_many() expects a list or tuple of node specs")
+        })?;
+
+        // Parse every spec up front so a malformed entry leaves the graph untouched
+        let mut parsed = Vec::with_capacity(specs.len());
+        for spec in specs {
+            let (function, label, inputs, outputs, options) = parse_node_spec(spec)?;
+            parsed.push((
+                function,
+                label,
+                parse_optional_mapping(inputs)?,
+                parse_optional_mapping(outputs)?,
+                options,
+            ));
+        }
 
-            graph.add(
-                rust_function,
-                label.as_deref(),
-                if input_refs.is_empty() {
-                    None
-                } else {
-                    Some(input_refs)
-                },
-                if output_refs.is_empty() {
-                    None
-                } else {
-                    Some(output_refs)
-                },
-            );
-        } else {
-            // No-op function if None provided - graph.add will handle Arc wrapping
-            let noop = |_: &HashMap<String, GraphData>| HashMap::new();
-            graph.add(
-                noop,
+        for (function, label, input_vec, output_vec, options) in parsed {
+            add_python_node(
+                graph,
+                function,
                 label.as_deref(),
-                if input_refs.is_empty() {
-                    None
-                } else {
-                    Some(input_refs)
-                },
-                if output_refs.is_empty() {
-                    None
-                } else {
-                    Some(output_refs)
-                },
+                &input_vec,
+                &output_vec,
+                options,
             );
         }
 
@@ -332,8 +351,8 @@ impl PyGraph {
     /// Args:
     ///     functions: List of Python callables, each with signature (inputs, variant_params) -> dict
     ///     label: Optional string label for the variant nodes
-    ///     inputs: Optional list of (broadcast_var, impl_var) tuples or dict
-    ///     outputs: Optional list of (impl_var, broadcast_var) tuples or dict
+    ///     inputs: Optional list or tuple of (broadcast_var, impl_var) pairs, or dict
+    ///     outputs: Optional list or tuple of (impl_var, broadcast_var) pairs, or dict
     ///
     /// Returns:
     ///     Self for method chaining
@@ -386,7 +405,7 @@ impl PyGraph {
         // Convert Python functions to Rust closures (Arc wrapping is now automatic in variants())
         let rust_functions: Vec<_> = functions
             .iter()
-            .map(|func| create_python_node_function(func.clone()))
+            .map(|func| create_python_node_function(func.clone(), output_keys(&output_vec)))
             .collect();
 
         // Call variants with the vector of closures
@@ -673,7 +692,150 @@ impl PyDag {
     }
 }
 
-/// Parse mapping from Python types (list of tuples or dict) to Vec<(String, String)>
+/// Parse an optional inputs/outputs mapping, treating `None` as empty
+fn parse_optional_mapping(obj: Option<&PyAny>) -> PyResult<Vec<(String, String)>> {
+    match obj {
+        Some(o) => parse_mapping(o),
+        None => Ok(Vec::new()),
+    }
+}
+
+/// Per-node options of a Python-backed node (see `Graph.add()`)
+#[derive(Clone, Copy, Default)]
+struct PyNodeOptions {
+    memoize: bool,
+    share_arrays: bool,
+}
+
+/// Add a single Python-backed node to a graph builder (shared by `add` and `add_many`)
+fn add_python_node(
+    graph: &mut Graph,
+    function: Option<PyObject>,
+    label: Option<&str>,
+    input_vec: &[(String, String)],
+    output_vec: &[(String, String)],
+    options: PyNodeOptions,
+) {
+    // Convert to references for the add method
+    let input_refs: Vec<(&str, &str)> = input_vec
+        .iter()
+        .map(|(a, b)| (a.as_str(), b.as_str()))
+        .collect();
+    let output_refs: Vec<(&str, &str)> = output_vec
+        .iter()
+        .map(|(a, b)| (a.as_str(), b.as_str()))
+        .collect();
+
+    let input_refs = if input_refs.is_empty() {
+        None
+    } else {
+        Some(input_refs)
+    };
+    let output_refs = if output_refs.is_empty() {
+        None
+    } else {
+        Some(output_refs)
+    };
+
+    // Create the node function
+    if let Some(py_func) = function {
+        // Wrap Python callable in a Rust closure - graph.add will handle Arc wrapping
+        let keys = output_keys(output_vec);
+        let call = try_python_node_function(py_func, keys, options.share_arrays);
+        if options.memoize {
+            graph.add(memoize_node_function(call), label, input_refs, output_refs);
+        } else {
+            let rust_function = move |inputs: &HashMap<String, GraphData>| {
+                call(inputs).unwrap_or_default()
+            };
+            graph.add(rust_function, label, input_refs, output_refs);
+        }
+    } else {
+        // No-op function if None provided - graph.add will handle Arc wrapping
+        let noop = |_: &HashMap<String, GraphData>| HashMap::new();
+        graph.add(noop, label, input_refs, output_refs);
+    }
+}
+
+/// Keys accepted in the dict form of an `add_many()` node spec
+const NODE_SPEC_KEYS: [&str; 6] = [
+    "function",
+    "label",
+    "inputs",
+    "outputs",
+    "memoize",
+    "share_arrays",
+];
+
+/// Node spec accepted by `Graph.add_many()`: (function, label, inputs, outputs, options)
+type PyNodeSpec<'a> = (
+    Option<PyObject>,
+    Option<String>,
+    Option<&'a PyAny>,
+    Option<&'a PyAny>,
+    PyNodeOptions,
+);
+
+/// Parse one `add_many()` entry (dict or positional tuple/list) into its parts
+fn parse_node_spec(spec: &PyAny) -> PyResult<PyNodeSpec<'_>> {
+    // Treat explicit Python `None` the same as an omitted field
+    fn opt(obj: Option<&PyAny>) -> Option<&PyAny> {
+        obj.filter(|o| !o.is_none())
+    }
+
+    if let Ok(dict) = spec.downcast::<PyDict>() {
+        // Reject unknown keys so a typo such as "input" is not silently ignored
+        for key in dict.keys() {
+            match key.extract::<&str>() {
+                Ok(name) if NODE_SPEC_KEYS.contains(&name) => {}
+                _ => {
+                    return Err(PyValueError::new_err(format!(
+                        "unknown node spec key {} (expected one of: {})",
+                        key.repr()?,
+                        NODE_SPEC_KEYS.join(", ")
+                    )))
+                }
+            }
+        }
+        let function = opt(dict.get_item("function")).map(|f| f.to_object(spec.py()));
+        let label = opt(dict.get_item("label"))
+            .map(|l| l.extract::<String>())
+            .transpose()?;
+        let flag = |name: &str| -> PyResult<bool> {
+            Ok(opt(dict.get_item(name))
+                .map(|v| v.extract::<bool>())
+                .transpose()?
+                .unwrap_or(false))
+        };
+        let options = PyNodeOptions {
+            memoize: flag("memoize")?,
+            share_arrays: flag("share_arrays")?,
+        };
+        Ok((
+            function,
+            label,
+            opt(dict.get_item("inputs")),
+            opt(dict.get_item("outputs")),
+            options,
+        ))
+    } else if let Ok(items) = spec.extract::<Vec<&PyAny>>() {
+        if items.is_empty() || items.len() > 4 {
+            return Err(PyValueError::new_err(
+                "node spec tuples must be (function, label, inputs, outputs)",
+            ));
+        }
+        let item = |i: usize| opt(items.get(i).copied());
+        let function = item(0).map(|f| f.to_object(spec.py()));
+        let label = item(1).map(|l| l.extract::<String>()).transpose()?;
+        Ok((function, label, item(2), item(3), PyNodeOptions::default()))
+    } else {
+        Err(PyValueError::new_err(
+            "add_many() expects a list of dicts or (function, label, inputs, outputs) tuples",
+        ))
+    }
+}
+
+/// Parse mapping from Python types (dict, list or tuple of pairs) to Vec<(String, String)>
 fn parse_mapping(obj: &PyAny) -> PyResult<Vec<(String, String)>> {
     if let Ok(dict) = obj.downcast::<PyDict>() {
         // Dict: {"key": "value"}
@@ -686,29 +848,63 @@ fn parse_mapping(obj: &PyAny) -> PyResult<Vec<(String, String)>> {
         Ok(result)
     } else if let Ok(list) = obj.downcast::<PyList>() {
         // List of tuples: [("key", "value")]
-        let mut result = Vec::new();
+        let mut result = Vec::with_capacity(list.len());
         for item in list.iter() {
             let tuple: (String, String) = item.extract()?;
             result.push(tuple);
         }
         Ok(result)
+    } else if let Ok(pairs) = obj.downcast::<PyTuple>() {
+        // Tuple of tuples: (("key", "value"),) - lets callers reuse module-level constants
+        let mut result = Vec::with_capacity(pairs.len());
+        for item in pairs.iter() {
+            let tuple: (String, String) = item.extract()?;
+            result.push(tuple);
+        }
+        Ok(result)
     } else {
         Err(PyValueError::new_err(
-            "inputs/outputs must be a dict or list of tuples",
+            "inputs/outputs must be a dict, list of tuples or tuple of tuples",
         ))
     }
 }
 
+/// Impl-side names of a node's outputs, i.e. the keys its function result is read by
+fn output_keys(output_vec: &[(String, String)]) -> Vec<String> {
+    output_vec.iter().map(|(impl_var, _)| impl_var.clone()).collect()
+}
+
 /// Create a node function that wraps a Python callable
 ///
 /// The returned closure is Send + Sync and properly handles GIL acquisition
-/// when calling the Python function.
+/// when calling the Python function. Only the keys in `output_keys` are
+/// converted from the returned dict; the node's output mapping would drop any
+/// others anyway. A failed call is reported on stderr and yields no outputs.
 fn create_python_node_function(
     py_func: PyObject,
+    output_keys: Vec<String>,
 ) -> impl Fn(&HashMap<String, GraphData>) -> HashMap<String, GraphData>
        + Send
        + Sync
        + 'static {
+    let call = try_python_node_function(py_func, output_keys, false);
+    move |inputs: &HashMap<String, GraphData>| call(inputs).unwrap_or_default()
+}
+
+/// Like `create_python_node_function`, but a failed call returns `None`
+///
+/// Failures (an input that cannot be converted, an exception, or a result
+/// that is not a dict) are still reported on stderr; the `None` lets callers
+/// such as the memo cache tell them apart from a call that returned no outputs.
+/// `share_arrays` is forwarded to `python_to_graph_data` for the outputs.
+fn try_python_node_function(
+    py_func: PyObject,
+    output_keys: Vec<String>,
+    share_arrays: bool,
+) -> impl Fn(&HashMap<String, GraphData>) -> Option<HashMap<String, GraphData>>
+       + Send
+       + Sync
+       + 'static {
     // Wrap in Arc to make it cloneable and shareable
     let py_func = Arc::new(py_func);
 
@@ -729,7 +925,7 @@ fn create_python_node_function(
                                 (format!("Error setting input '{}': {}\n", key, e),),
                             )
                         });
-                    return HashMap::new();
+                    return None;
                 }
             }
 
@@ -740,13 +936,13 @@ fn create_python_node_function(
                 Ok(py_result) => {
                     // Convert result back to HashMap
                     if let Ok(result_dict) = py_result.downcast::<PyDict>(py) {
-                        let mut output = HashMap::new();
-                        for (key, value) in result_dict.iter() {
-                            if let Ok(k) = key.extract::<String>() {
-                                output.insert(k, python_to_graph_data(value));
+                        let mut output = HashMap::with_capacity(output_keys.len());
+                        for key in &output_keys {
+                            if let Some(value) = result_dict.get_item(key.as_str()) {
+                                output.insert(key.clone(), python_to_graph_data(value, share_arrays));
                             }
                         }
-                        output
+                        Some(output)
                     } else {
                         let _ = py
                             .import("sys")
@@ -757,19 +953,134 @@ fn create_python_node_function(
                                     ("Error: Python function did not return a dict\n",),
                                 )
                             });
-                        HashMap::new()
+                        None
                     }
                 }
                 Err(e) => {
                     // Use Python's traceback printing for better error visibility
                     e.print(py);
-                    HashMap::new()
+                    None
                 }
             }
         })
     }
 }
 
+/// Maximum number of cached input sets per memoized node
+const MEMO_CAPACITY: usize = 128;
+
+/// Cached (inputs, outputs) pairs of a memoized node, keyed by input hash
+type MemoCache = HashMap<u64, (HashMap<String, GraphData>, HashMap<String, GraphData>)>;
+
+/// Wrap a fallible node function with an input-keyed output cache
+///
+/// Entries are looked up by input hash and only returned when the stored
+/// inputs compare equal, so a hash collision is a miss rather than a wrong
+/// result. Failed calls (`None`) are not cached, so the next execution retries
+/// them. The cache is cleared once it reaches `MEMO_CAPACITY` entries, which
+/// keeps memory bounded without per-call LRU bookkeeping.
+fn memoize_node_function<F>(
+    func: F,
+) -> impl Fn(&HashMap<String, GraphData>) -> HashMap<String, GraphData> + Send + Sync + 'static
+where
+    F: Fn(&HashMap<String, GraphData>) -> Option<HashMap<String, GraphData>>
+        + Send
+        + Sync
+        + 'static,
+{
+    let cache: Mutex<MemoCache> = Mutex::new(HashMap::new());
+
+    move |inputs: &HashMap<String, GraphData>| {
+        let key = match memo_key(inputs) {
+            Some(key) => key,
+            None => return func(inputs).unwrap_or_default(),
+        };
+
+        if let Some((cached_inputs, outputs)) = cache.lock().unwrap().get(&key) {
+            if same_inputs(cached_inputs, inputs) {
+                return outputs.clone();
+            }
+        }
+
+        // Call without holding the lock so parallel executions of this node
+        // don't serialise on the cache
+        let outputs = match func(inputs) {
+            Some(outputs) => outputs,
+            None => return HashMap::new(),
+        };
+        let mut cache = cache.lock().unwrap();
+        if cache.len() >= MEMO_CAPACITY {
+            cache.clear();
+        }
+        // Vector inputs are Arc-backed, so keeping the inputs is cheap
+        cache.insert(key, (inputs.clone(), outputs.clone()));
+        outputs
+    }
+}
+
+/// Hash a node's inputs in key order, or `None` if any value is unhashable
+fn memo_key(inputs: &HashMap<String, GraphData>) -> Option<u64> {
+    let mut keys: Vec<&String> = inputs.keys().collect();
+    keys.sort_unstable();
+
+    let mut hasher = DefaultHasher::new();
+    for key in keys {
+        key.hash(&mut hasher);
+        if !hash_graph_data(&inputs[key], &mut hasher) {
+            return None;
+        }
+    }
+    Some(hasher.finish())
+}
+
+/// Feed a GraphData value into `hasher`, returning false for opaque values
+fn hash_graph_data(data: &GraphData, hasher: &mut DefaultHasher) -> bool {
+    std::mem::discriminant(data).hash(hasher);
+    match data {
+        GraphData::Int(v) => v.hash(hasher),
+        GraphData::Float(v) => v.to_bits().hash(hasher),
+        GraphData::String(s) => s.hash(hasher),
+        GraphData::FloatVec(v) => {
+            v.len().hash(hasher);
+            for x in v.iter() {
+                x.to_bits().hash(hasher);
+            }
+        }
+        GraphData::IntVec(v) => v.hash(hasher),
+        GraphData::Map(m) => return memo_key(m).map(|k| k.hash(hasher)).is_some(),
+        GraphData::None => {}
+        #[allow(unreachable_patterns)]
+        _ => return false,
+    }
+    true
+}
+
+/// Compare two input maps value by value, using the same rules as `memo_key`
+fn same_inputs(a: &HashMap<String, GraphData>, b: &HashMap<String, GraphData>) -> bool {
+    a.len() == b.len()
+        && a
+            .iter()
+            .all(|(key, value)| b.get(key).map_or(false, |other| same_graph_data(value, other)))
+}
+
+/// Equality for the GraphData values `hash_graph_data` accepts; opaque values never match
+fn same_graph_data(a: &GraphData, b: &GraphData) -> bool {
+    match (a, b) {
+        (GraphData::Int(x), GraphData::Int(y)) => x == y,
+        (GraphData::Float(x), GraphData::Float(y)) => x.to_bits() == y.to_bits(),
+        (GraphData::String(x), GraphData::String(y)) => x == y,
+        (GraphData::FloatVec(x), GraphData::FloatVec(y)) => {
+            Arc::ptr_eq(x, y)
+                || (x.len() == y.len()
+                    && x.iter().zip(y.iter()).all(|(p, q)| p.to_bits() == q.to_bits()))
+        }
+        (GraphData::IntVec(x), GraphData::IntVec(y)) => Arc::ptr_eq(x, y) || x == y,
+        (GraphData::Map(x), GraphData::Map(y)) => same_inputs(x, y),
+        (GraphData::None, GraphData::None) => true,
+        _ => false,
+    }
+}
+
 /// Convert GraphData to Python object
 fn graph_data_to_python(py: Python, data: &GraphData) -> PyObject {
     match data {
@@ -886,7 +1197,10 @@ fn graph_data_to_python(py: Python, data: &GraphData) -> PyObject {
 }
 
 /// Convert Python object to GraphData
-fn python_to_graph_data(obj: &PyAny) -> GraphData {
+///
+/// With `share_arrays`, NumPy arrays (anything exposing `__array_interface__`)
+/// are kept as the original object instead of being converted to a list.
+fn python_to_graph_data(obj: &PyAny, share_arrays: bool) -> GraphData {
     // Try numeric scalars first
     if let Ok(f) = obj.extract::<f64>() {
         return GraphData::Float(f);
@@ -897,6 +1211,12 @@ fn python_to_graph_data(obj: &PyAny) -> GraphData {
     if let Ok(s) = obj.extract::<String>() {
         return GraphData::String(s);
     }
+    // Plain lists and tuples are the common case, so convert them before
+    // probing for the array interface
+    let is_sequence = obj.downcast::<PyList>().is_ok() || obj.downcast::<PyTuple>().is_ok();
+    if !is_sequence && share_arrays && obj.hasattr("__array_interface__").unwrap_or(false) {
+        return GraphData::PyObject(obj.to_object(obj.py()));
+    }
     // Try list-of-floats → FloatVec, list-of-ints → IntVec
     if let Ok(list) = obj.extract::<Vec<f64>>() {
         return GraphData::FloatVec(std::sync::Arc::new(list));
@@ -363,6 +363,75 @@ fn test_execute_detailed_branch_outputs() {
     assert_eq!(bout.get("result_a").and_then(|d| d.as_int()), Some(101));
 }
 
+/// Integer view of an output map, since GraphData has no PartialEq
+fn int_view(outputs: &HashMap<String, GraphData>) -> HashMap<String, Option<i64>> {
+    outputs.iter().map(|(k, v)| (k.clone(), v.as_int())).collect()
+}
+
+#[test]
+fn test_execute_detailed_level_wider_than_max_threads() {
+    let mut graph = Graph::new();
+    graph.add(data_source, Some("Source"), None, Some(vec![("raw_data", "data")]));
+
+    // Five single-node branches off the source form one level of five nodes
+    let mut branch_ids = Vec::new();
+    for k in 1..=5i64 {
+        let mut branch = Graph::new();
+        let out_name = format!("out_{k}");
+        branch.add(
+            move |inputs: &HashMap<String, GraphData>| {
+                let mut out = HashMap::new();
+                if let Some(v) = inputs.get("x").and_then(|d| d.as_int()) {
+                    out.insert("y".to_string(), GraphData::int(v * k));
+                }
+                out
+            },
+            Some("Scale"), Some(vec![("data", "x")]), Some(vec![("y", out_name.as_str())]),
+        );
+        branch_ids.push(graph.branch(branch));
+    }
+
+    let dag = graph.build();
+    assert!(dag.execution_levels().iter().any(|level| level.len() == 5));
+
+    let sequential = dag.execute_detailed(false, None);
+    let expected_context = int_view(&sequential.context);
+    assert_eq!(expected_context.get("data"), Some(&Some(100)));
+
+    for max_threads in [Some(1), Some(2)] {
+        let result = dag.execute_detailed(true, max_threads);
+
+        // Every node's outputs are recorded, in node_outputs and in the context
+        for node in dag.nodes() {
+            let outputs = result
+                .get_node_outputs(node.id)
+                .unwrap_or_else(|| panic!("node {} missing with {max_threads:?}", node.id));
+            assert_eq!(outputs.len(), node.output_mapping.len());
+            for key in outputs.keys() {
+                let context_key = match node.branch_id {
+                    Some(bid) => format!("__branch_{bid}__{key}"),
+                    None => key.clone(),
+                };
+                assert!(result.contains_key(&context_key), "{context_key} missing");
+            }
+            let expected = int_view(sequential.get_node_outputs(node.id).unwrap());
+            assert_eq!(int_view(outputs), expected, "node {} with {max_threads:?}", node.id);
+        }
+
+        for (k, &bid) in branch_ids.iter().enumerate() {
+            let key = format!("out_{}", k + 1);
+            let bout = result.get_branch_outputs(bid).expect("branch outputs missing");
+            assert_eq!(bout.get(&key).and_then(|d| d.as_int()), Some(100 * (k as i64 + 1)));
+            assert_eq!(
+                int_view(bout),
+                int_view(sequential.get_branch_outputs(bid).unwrap()),
+            );
+        }
+
+        assert_eq!(int_view(&result.context), expected_context, "with {max_threads:?}");
+    }
+}
+
 #[test]
 fn test_execute_get_from_node_and_branch() {
     let mut graph = Graph::new();
@@ -94,3 +94,25 @@ fn test_processor_formatter_mermaid() {
     assert!(mermaid.contains("Formatter"), "mermaid missing 'Formatter': {}", mermaid);
     assert!(mermaid.contains("data → input") || mermaid.contains("data \u{2192} input"), "mermaid missing 'data → input': {}", mermaid);
 }
+
+#[test]
+fn test_mermaid_repeated_calls_match() {
+    let mut g = Graph::new();
+
+    g.add(
+        |_: &HashMap<String, GraphData>| {
+            let mut o = HashMap::new();
+            o.insert("n".to_string(), GraphData::int(1));
+            o
+        } ,
+        Some("Source"),
+        None,
+        Some(vec![("n", "x")]),
+    );
+
+    let dag = g.build();
+    let first = dag.to_mermaid();
+    let _ = dag.execute(false, None);
+
+    assert_eq!(first, dag.to_mermaid());
+}